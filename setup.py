@@ -0,0 +1,18 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        "torchlet/_engine.pyx",
+        compiler_directives={"language_level": "3"},
+    )
+except ImportError:
+    # Cython is optional: without it torchlet runs on the pure-Python engine.
+    ext_modules = []
+
+setup(
+    name="torchlet",
+    packages=["torchlet"],
+    ext_modules=ext_modules,
+)
@@ -1,25 +1,121 @@
-from torchlet.engine import Element
-
-
-def test_basic_operations():
-    a = Element(2.0)
-    b = Element(3.0)
-    c = a + b
-    assert c.data == 5.0, "Addition test failed"
-    d = a * b
-    assert d.data == 6.0, "Multiplication test failed"
-
-
-def test_backward():
-    a = Element(2.0)
-    b = Element(3.0)
-    c = a + b
-    c.backward()
-    assert a.grad == 1.0, "Backward test failed for a"
-    assert b.grad == 1.0, "Backward test failed for b"
-
-
-if __name__ == "__main__":
-    test_basic_operations()
-    test_backward()
-    print("All tests passed!")
+import numpy as np
+
+from torchlet.engine import CElement
+from torchlet.engine import Element
+from torchlet.engine import no_grad
+from torchlet.nn import MLP
+
+
+def test_basic_operations():
+    a = Element(2.0)
+    b = Element(3.0)
+    c = a + b
+    assert c.data == 5.0, "Addition test failed"
+    d = a * b
+    assert d.data == 6.0, "Multiplication test failed"
+
+
+def test_backward():
+    a = Element(2.0)
+    b = Element(3.0)
+    c = a + b
+    c.backward()
+    assert a.grad == 1.0, "Backward test failed for a"
+    assert b.grad == 1.0, "Backward test failed for b"
+
+
+def test_matmul_backward():
+    W = Element(np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))
+    x = Element(np.array([1.0, -1.0, 2.0]))
+    y = W @ x
+    assert np.allclose(y.data, W.data @ x.data), "Matmul forward test failed"
+    loss = y @ Element(np.ones(2))
+    loss.backward()
+    assert np.allclose(W.grad, np.outer(np.ones(2), x.data)), "Matmul W grad failed"
+    assert np.allclose(x.grad, W.data.T @ np.ones(2)), "Matmul x grad failed"
+    # vector @ matrix: the matrix gradient is the outer product, not a dot
+    x2 = Element(np.array([1.0, 2.0]))
+    W2 = Element(np.eye(2))
+    (x2 @ W2 @ Element(np.ones(2))).backward()
+    assert np.allclose(W2.grad, np.outer(x2.data, np.ones(2))), "x @ W grad failed"
+    assert np.allclose(x2.grad, np.ones(2)), "x @ W x grad failed"
+
+
+def test_dot_backward():
+    w = Element(np.array([1.0, 2.0, 3.0]))
+    x = Element(np.array([4.0, 5.0, 6.0]))
+    b = Element(0.5)
+    out = w.dot(x, b)
+    assert out.data == np.dot(w.data, x.data) + 0.5, "Dot forward test failed"
+    out.backward()
+    assert np.allclose(w.grad, x.data), "Dot w grad failed"
+    assert np.allclose(x.grad, w.data), "Dot x grad failed"
+    assert b.grad == 1.0, "Dot b grad failed"
+
+
+def test_broadcast_backward():
+    s = Element(2.0)
+    v = Element(np.array([1.0, 2.0, 3.0]))
+    out = (s * v) @ Element(np.ones(3))
+    out.backward()
+    # d(sum(s*v))/ds reduces the broadcast back to the scalar operand
+    assert abs(float(s.grad) - 6.0) < 1e-12, "Broadcast scalar grad failed"
+    assert np.allclose(v.grad, [2.0, 2.0, 2.0]), "Broadcast vector grad failed"
+
+
+def test_mlp_gradcheck():
+    mlp = MLP(3, [4, 1])
+    x = [Element(1.0), Element(2.0), Element(3.0)]
+    loss = mlp(x) @ Element(np.ones(1))
+    loss.backward()
+    # Finite-difference check against the flat parameter buffer
+    eps = 1e-6
+    for i in range(mlp._param_data.size):
+        orig = mlp._param_data[i]
+        mlp._param_data[i] = orig + eps
+        with no_grad():
+            plus = float(mlp(x).data @ np.ones(1))
+        mlp._param_data[i] = orig - eps
+        with no_grad():
+            minus = float(mlp(x).data @ np.ones(1))
+        mlp._param_data[i] = orig
+        numeric = (plus - minus) / (2 * eps)
+        assert abs(mlp._param_grad[i] - numeric) < 1e-4, f"MLP gradcheck failed at {i}"
+
+
+def test_no_grad():
+    with no_grad():
+        c = Element(2.0) * Element(3.0) + Element(1.0)
+    assert c.data == 7.0, "no_grad forward test failed"
+    assert c._prev == (), "no_grad should not record children"
+    # graph construction is restored on exit
+    d = Element(2.0) * Element(3.0)
+    assert d._prev != (), "grad mode not restored after no_grad"
+    d.backward()
+
+
+def test_celement_parity():
+    def build(cls):
+        a = cls(2.0)
+        b = cls(3.0)
+        c = (a * b + a) / b - (-a) + a**2
+        c.backward()
+        return c.data, a.grad, b.grad
+
+    e_data, e_ga, e_gb = build(Element)
+    c_data, c_ga, c_gb = build(CElement)
+    assert abs(e_data - c_data) < 1e-12, "CElement data parity failed"
+    assert abs(e_ga - c_ga) < 1e-12, "CElement grad parity failed for a"
+    assert abs(e_gb - c_gb) < 1e-12, "CElement grad parity failed for b"
+
+
+if __name__ == "__main__":
+    test_basic_operations()
+    test_backward()
+    test_matmul_backward()
+    test_dot_backward()
+    test_broadcast_backward()
+    test_mlp_gradcheck()
+    test_no_grad()
+    test_celement_parity()
+    print("All tests passed!")
@@ -0,0 +1,4 @@
+from torchlet.engine import Element
+from torchlet.engine import no_grad
+
+__all__ = ["Element", "no_grad"]
@@ -1,23 +1,252 @@
+from contextlib import contextmanager
+
 import numpy as np
 
 from torchlet.visualization import check_graphviz_installed
 from torchlet.visualization import draw_graphviz
 from torchlet.visualization import draw_matplotlib
 
+# Op codes stored on each Element instead of per-op backward closures.
+OP_NONE, OP_ADD, OP_MUL, OP_POW, OP_RELU, OP_MATMUL, OP_DOT, OP_DIV, OP_NEG = range(9)
+
+
+# Gradient mode flag, toggled by no_grad(). Held in a one-element list so the
+# hot op constructors read it with a single indexed load.
+_GRAD_ENABLED = [True]
+
+
+@contextmanager
+def no_grad():
+    """Disables graph construction inside the context.
+
+    Ops executed under no_grad() return bare Elements holding only the
+    result data -- no _prev tuple, op code or backward metadata -- halving
+    per-op allocations for inference and validation passes.
+    """
+    prev = _GRAD_ENABLED[0]
+    _GRAD_ENABLED[0] = False
+    try:
+        yield
+    finally:
+        _GRAD_ENABLED[0] = prev
+
+
+def _fdiv(a, b):
+    """Divides two scalars with NumPy semantics for a zero divisor.
+
+    Python float division raises ZeroDivisionError where the array paths
+    propagate inf/nan (with the usual RuntimeWarning); route the zero-divisor
+    case through np.float64 so the scalar fast paths behave the same.
+    """
+    if b == 0.0:
+        return float(np.float64(a) / np.float64(b))
+    return a / b
+
+
+def _fpow(a, b):
+    """Raises a scalar to a power with NumPy semantics for a zero base.
+
+    Python raises ZeroDivisionError for 0.0 ** negative where the array
+    paths propagate inf (with a RuntimeWarning); same trick as _fdiv.
+    """
+    if a == 0.0 and b < 0.0:
+        return float(np.float64(a) ** np.float64(b))
+    return a**b
+
+
+def _unbroadcast(grad, shape):
+    """Reduces a broadcasted gradient back to the shape of its operand.
+
+    Args:
+        grad (np.ndarray): The upstream gradient, possibly broadcasted.
+        shape (tuple): The shape of the operand to reduce to.
+
+    Returns:
+        np.ndarray: The gradient summed over the broadcasted axes.
+    """
+    if grad.shape == shape:
+        return grad
+    while grad.ndim > len(shape):
+        grad = grad.sum(axis=0)
+    for axis, dim in enumerate(shape):
+        if dim == 1 and grad.shape[axis] != 1:
+            grad = grad.sum(axis=axis, keepdims=True)
+    return grad
+
+
+def _noop_bwd(v):
+    """Backward for leaves and ops with no gradient contribution."""
+
+
+def _add_bwd(v):
+    a, b = v._prev
+    if type(v.data) is float:
+        # scalar output implies scalar operands
+        if a.requires_grad:
+            a._ensure_grad_initialized()
+            a.grad += v.grad
+        if b.requires_grad:
+            b._ensure_grad_initialized()
+            b.grad += v.grad
+    else:
+        if a.requires_grad:
+            a._ensure_grad_initialized()
+            a.grad += _unbroadcast(v.grad, np.shape(a.data))
+        if b.requires_grad:
+            b._ensure_grad_initialized()
+            b.grad += _unbroadcast(v.grad, np.shape(b.data))
+
+
+def _mul_bwd(v):
+    a, b = v._prev
+    if type(v.data) is float:
+        if a.requires_grad:
+            a._ensure_grad_initialized()
+            a.grad += b.data * v.grad
+        if b.requires_grad:
+            b._ensure_grad_initialized()
+            b.grad += a.data * v.grad
+    else:
+        if a.requires_grad:
+            a._ensure_grad_initialized()
+            a.grad += _unbroadcast(b.data * v.grad, np.shape(a.data))
+        if b.requires_grad:
+            b._ensure_grad_initialized()
+            b.grad += _unbroadcast(a.data * v.grad, np.shape(b.data))
+
+
+def _pow_bwd(v):
+    (a,) = v._prev
+    a._ensure_grad_initialized()
+    a.grad += v._meta * v.grad
+
+
+def _relu_bwd(v):
+    (a,) = v._prev
+    a._ensure_grad_initialized()
+    a.grad += (v.data > 0) * v.grad
+
+
+def _matmul_bwd(v):
+    a, b = v._prev
+    if a.requires_grad:
+        a._ensure_grad_initialized()
+        if b.data.ndim == 1 and a.data.ndim > 1:
+            # matrix @ vector -> vector output
+            a.grad += np.outer(v.grad, b.data)
+        elif a.data.ndim == 1 and b.data.ndim == 1:
+            # vector @ vector -> scalar output
+            a.grad += v.grad * b.data
+        else:
+            a.grad += v.grad @ b.data.T
+    if b.requires_grad:
+        b._ensure_grad_initialized()
+        if a.data.ndim == 1 and b.data.ndim == 1:
+            b.grad += v.grad * a.data
+        elif a.data.ndim == 1:
+            # vector @ matrix -> vector output
+            b.grad += np.outer(a.data, v.grad)
+        else:
+            b.grad += a.data.T @ v.grad
+
+
+def _dot_bwd(v):
+    w, x, b = v._prev
+    if w.requires_grad:
+        w._ensure_grad_initialized()
+        w.grad += v.grad * x.data
+    if x.requires_grad:
+        x._ensure_grad_initialized()
+        x.grad += v.grad * w.data
+    if b.requires_grad:
+        b._ensure_grad_initialized()
+        b.grad += v.grad
+
+
+def _div_bwd(v):
+    a, b = v._prev
+    if type(v.data) is float:
+        if a.requires_grad:
+            a._ensure_grad_initialized()
+            a.grad += _fdiv(v.grad, b.data)
+        if b.requires_grad:
+            b._ensure_grad_initialized()
+            b.grad += _fdiv(-a.data, b.data * b.data) * v.grad
+    else:
+        if a.requires_grad:
+            a._ensure_grad_initialized()
+            a.grad += _unbroadcast(v.grad / b.data, np.shape(a.data))
+        if b.requires_grad:
+            b._ensure_grad_initialized()
+            b.grad += _unbroadcast(
+                -a.data / (b.data * b.data) * v.grad, np.shape(b.data)
+            )
+
+
+def _neg_bwd(v):
+    (a,) = v._prev
+    a._ensure_grad_initialized()
+    a.grad -= v.grad
+
+
+# Backward dispatch table indexed by _op_id: one list index plus call per
+# node instead of walking an if/elif chain in the backward loop.
+_BWD_TABLE = (
+    _noop_bwd,
+    _add_bwd,
+    _mul_bwd,
+    _pow_bwd,
+    _relu_bwd,
+    _matmul_bwd,
+    _dot_bwd,
+    _div_bwd,
+    _neg_bwd,
+)
+
 
 class Element:
     """Stores a scalar or vector and its gradient, along with an optional label.
 
     Attributes:
-        data (np.ndarray): The value of the element.
-        grad (np.ndarray or None): The gradient of the element, initialized to None.
+        data (float or np.ndarray): The value of the element. Scalars are kept
+            as Python floats, arrays as float64 ndarrays.
+        grad (float, np.ndarray or None): The gradient of the element, matching
+            the type of data; initialized to None.
+        requires_grad (bool): Whether backward should accumulate a gradient for
+            this element. Propagated through ops: an op output requires grad
+            iff any of its operands does.
         label (str): The optional label for the element.
-        _backward (function): The function to compute the backward pass.
-        _prev (set): Set of parent elements in the computation graph.
+        _prev (tuple): Parent elements in the computation graph, in operand order.
         _op (str): The operation that produced this element.
+        _op_id (int): Integer op code used to dispatch the backward pass.
+        _meta: Extra scalar metadata for the op (e.g. the exponent for pow).
     """
 
-    def __init__(self, data, _children=(), _op="", label=None):
+    # Slots replace the per-instance __dict__: thousands of tiny Elements are
+    # created per forward pass, so dict overhead dominates both memory and
+    # attribute access time. `label` stays because it is assigned after
+    # construction (e.g. in visualization examples).
+    __slots__ = (
+        "data",
+        "grad",
+        "_prev",
+        "_op",
+        "_op_id",
+        "_meta",
+        "_topo_cache",
+        "_topo_gen",
+        "requires_grad",
+        "label",
+        # Slotted classes drop weakref support unless declared; keep Elements
+        # weakref-able as the dict-based class was.
+        "__weakref__",
+    )
+
+    # Generation counter bumped whenever a new op node is constructed; used to
+    # invalidate cached topological orders when the graph grows.
+    _gen = 0
+
+    def __init__(self, data, _children=(), _op="", label=None, requires_grad=True):
         """Initializes an Element with data, optional gradient, and label.
 
         Args:
@@ -25,22 +254,43 @@ class Element:
             _children (tuple, optional): Parent elements in the computation graph.
             _op (str, optional): The operation that produced this element.
             label (str, optional): The label for the element.
+            requires_grad (bool, optional): Whether backward should accumulate
+                a gradient for this element. Pass False for constant inputs to
+                skip their gradient allocation and accumulation entirely.
         """
-        self.data = (
-            np.array(data, dtype=np.float64)
-            if not isinstance(data, np.ndarray)
-            else data.astype(np.float64)
-        )
+        if type(data) is float:
+            # Exact-type fast path: op results are always plain floats, so the
+            # hot constructor call does no conversion at all.
+            self.data = data
+        elif isinstance(data, (int, float)):
+            # Scalars stay as Python floats: a float op is a single C-level
+            # binary op, ~20x cheaper than NumPy's 0-d ufunc dispatch.
+            self.data = float(data)
+        elif isinstance(data, np.ndarray):
+            # astype unconditionally copies; already-float64 arrays are used
+            # as-is.
+            self.data = data if data.dtype == np.float64 else data.astype(np.float64)
+        else:
+            self.data = np.array(data, dtype=np.float64)
         self.grad = None  # Lazy initialization of gradients
-        self._backward = lambda: None
-        self._prev = set(_children)
+        self._prev = tuple(_children)
         self._op = _op
+        self._op_id = OP_NONE
+        self._meta = None
+        self._topo_cache = None
+        self._topo_gen = None
+        self.requires_grad = requires_grad
         self.label = label
+        if _children:
+            Element._gen += 1
 
     def _ensure_grad_initialized(self) -> None:
         """Ensures that the gradient is initialized."""
         if self.grad is None:
-            self.grad = np.zeros_like(self.data, dtype=np.float64)
+            if type(self.data) is float:
+                self.grad = 0.0
+            else:
+                self.grad = np.zeros_like(self.data, dtype=np.float64)
 
     def __add__(self, other) -> "Element":
         """Performs addition with another Element or scalar.
@@ -52,16 +302,12 @@ class Element:
             Element: A new Element representing the result.
         """
         other = other if isinstance(other, Element) else Element(other)
-        out = Element(self.data + other.data, (self, other), "+")
-
-        def _backward():
-            self._ensure_grad_initialized()
-            other._ensure_grad_initialized()
-            self.grad += out.grad
-            other.grad += out.grad
-
-        out._backward = _backward
-
+        d = self.data + other.data
+        if not _GRAD_ENABLED[0]:
+            return Element(d)
+        out = Element(d, (self, other), "+")
+        out._op_id = OP_ADD
+        out.requires_grad = self.requires_grad or other.requires_grad
         return out
 
     def __mul__(self, other) -> "Element":
@@ -74,16 +320,12 @@ class Element:
             Element: A new Element representing the result.
         """
         other = other if isinstance(other, Element) else Element(other)
-        out = Element(self.data * other.data, (self, other), "*")
-
-        def _backward():
-            self._ensure_grad_initialized()
-            other._ensure_grad_initialized()
-            self.grad += other.data * out.grad
-            other.grad += self.data * out.grad
-
-        out._backward = _backward
-
+        d = self.data * other.data
+        if not _GRAD_ENABLED[0]:
+            return Element(d)
+        out = Element(d, (self, other), "*")
+        out._op_id = OP_MUL
+        out.requires_grad = self.requires_grad or other.requires_grad
         return out
 
     def __pow__(self, other) -> "Element":
@@ -98,49 +340,146 @@ class Element:
         assert isinstance(
             other, (int, float)
         ), "Torchlet only supports int/float powers for now"
-        out = Element(self.data**other, (self,), f"**{other}")
-
-        def _backward():
-            self._ensure_grad_initialized()
-            other._ensure_grad_initialized()
-            self.grad += (other * self.data ** (other - 1)) * out.grad
+        # Fast-path the common exponents: reciprocal and square avoid the pow
+        # call entirely (a divide or multiply vs tens of cycles for pow). The
+        # local gradient coefficient d(x**n)/dx is precomputed here and stored
+        # in _meta so backward is a single multiply for every exponent.
+        if other == -1:
+            if type(self.data) is float:
+                d = _fdiv(1.0, self.data)
+            else:
+                d = 1.0 / self.data
+        elif other == 2:
+            d = self.data * self.data
+        elif type(self.data) is float:
+            d = _fpow(self.data, other)
+        else:
+            d = self.data**other
+        if not _GRAD_ENABLED[0]:
+            return Element(d)
+        if other == -1:
+            grad_coef = -d * d
+        elif other == 2:
+            grad_coef = 2.0 * self.data
+        elif type(self.data) is float:
+            grad_coef = other * _fpow(self.data, other - 1)
+        else:
+            grad_coef = other * self.data ** (other - 1)
+        out = Element(d, (self,), f"**{other}")
+        out._op_id = OP_POW
+        out._meta = grad_coef
+        out.requires_grad = self.requires_grad
+        return out
 
-        out._backward = _backward
+    def __matmul__(self, other) -> "Element":
+        """Performs matrix multiplication with another Element.
 
-        return out
+        Handles matrix @ matrix, matrix @ vector, and vector @ vector (dot
+        product) operands so that a whole layer can be one graph node.
 
-    def relu(self) -> "Element":
-        """Applies the ReLU activation function to the Element.
+        Args:
+            other (Element or np.ndarray): The element to matrix-multiply with.
 
         Returns:
             Element: A new Element representing the result.
         """
-        out = Element(0 if self.data < 0 else self.data, (self,), "ReLU")
+        other = other if isinstance(other, Element) else Element(other)
+        if not _GRAD_ENABLED[0]:
+            return Element(self.data @ other.data)
+        out = Element(self.data @ other.data, (self, other), "@")
+        out._op_id = OP_MATMUL
+        out.requires_grad = self.requires_grad or other.requires_grad
+        return out
+
+    def dot(self, x, b) -> "Element":
+        """Performs a fused dot product with bias: `self . x + b`.
 
-        def _backward():
-            self._ensure_grad_initialized()
-            self.grad += (out.data > 0) * out.grad
+        Collapses what would be a matmul node plus an add node (and, in the
+        scalar API, 2*nin intermediate nodes) into a single graph node whose
+        backward updates all three operands in one vectorized step.
 
-        out._backward = _backward
+        Args:
+            x (Element): The input vector Element.
+            b (Element): The scalar bias Element.
 
+        Returns:
+            Element: A new scalar Element representing `self . x + b`.
+        """
+        x = x if isinstance(x, Element) else Element(x)
+        b = b if isinstance(b, Element) else Element(b)
+        d = float(np.dot(self.data, x.data)) + b.data
+        if not _GRAD_ENABLED[0]:
+            return Element(d)
+        out = Element(d, (self, x, b), "dot")
+        out._op_id = OP_DOT
+        out.requires_grad = self.requires_grad or x.requires_grad or b.requires_grad
         return out
 
-    def backward(self) -> None:
-        """Computes the gradient of the Element via backpropagation (via reverse-mode autodiff on dynamic DAG)."""
-        topo = []
-        visited = set()
+    def relu(self) -> "Element":
+        """Applies the ReLU activation function to the Element.
+
+        Returns:
+            Element: A new Element representing the result.
+        """
+        if type(self.data) is float:
+            d = self.data if self.data > 0.0 else 0.0
+        else:
+            d = np.maximum(0, self.data)
+        if not _GRAD_ENABLED[0]:
+            return Element(d)
+        out = Element(d, (self,), "ReLU")
+        out._op_id = OP_RELU
+        out.requires_grad = self.requires_grad
+        return out
 
-        def build_topo(v):
-            if v not in visited:
-                visited.add(v)
-                for child in v._prev:
-                    build_topo(child)
-                topo.append(v)
+    def backward(self, leaves_only=False) -> None:
+        """Computes the gradient of the Element via backpropagation (via reverse-mode autodiff on dynamic DAG).
 
-        build_topo(self)
-        self.grad = np.ones_like(self.data, dtype=np.float64)
+        Args:
+            leaves_only (bool, optional): If True, gradients are only retained
+                on leaf nodes (parameters and inputs); each intermediate's grad
+                is released as soon as it has been propagated through, saving
+                the per-node grad storage in training loops that only consume
+                parameter gradients.
+        """
+        # Reuse the topological order across repeated backward calls on the
+        # same root: the order only changes when new op nodes are built, which
+        # the class-level generation counter tracks.
+        if self._topo_cache is not None and self._topo_gen == Element._gen:
+            topo = self._topo_cache
+        else:
+            # Iterative DFS: avoids one Python frame per node and the recursion
+            # limit on deep graphs. A node is pushed twice; the second pop (with
+            # the processed flag set) appends it after all of its children.
+            topo = []
+            visited = set()
+            stack = [(self, False)]
+            while stack:
+                node, processed = stack.pop()
+                if processed:
+                    topo.append(node)
+                    continue
+                if node in visited:
+                    continue
+                visited.add(node)
+                stack.append((node, True))
+                stack.extend((child, False) for child in node._prev)
+            self._topo_cache = topo
+            self._topo_gen = Element._gen
+        if type(self.data) is float:
+            self.grad = 1.0
+        else:
+            self.grad = np.ones_like(self.data, dtype=np.float64)
         for v in reversed(topo):
-            v._backward()
+            # Nodes that don't require grad have no parameter anywhere below
+            # them, so the whole update (and their operands') can be skipped.
+            if v.requires_grad:
+                _BWD_TABLE[v._op_id](v)
+                # The reverse topological order guarantees every consumer of v
+                # has already run, so v's grad is fully propagated and can be
+                # dropped once it is no longer wanted.
+                if leaves_only and v._prev and v is not self:
+                    v.grad = None
 
     def visualize(self, method="matplotlib"):
         """Visualizes the computational graph for this Element.
@@ -192,7 +531,12 @@ class Element:
         Returns:
             Element: A new Element representing the negation.
         """
-        return self * -1
+        if not _GRAD_ENABLED[0]:
+            return Element(-self.data)
+        out = Element(-self.data, (self,), "neg")
+        out._op_id = OP_NEG
+        out.requires_grad = self.requires_grad
+        return out
 
     def __radd__(self, other) -> "Element":
         """Performs addition with another Element or scalar. This is the reverse fallback for addition.
@@ -247,7 +591,19 @@ class Element:
         Returns:
             Element: A new Element representing the result.
         """
-        return self * other**-1
+        if not isinstance(other, Element):
+            # Dividing by a constant folds into one reciprocal multiply.
+            return self * (1.0 / other)
+        if type(self.data) is float and type(other.data) is float:
+            d = _fdiv(self.data, other.data)
+        else:
+            d = self.data / other.data
+        if not _GRAD_ENABLED[0]:
+            return Element(d)
+        out = Element(d, (self, other), "/")
+        out._op_id = OP_DIV
+        out.requires_grad = self.requires_grad or other.requires_grad
+        return out
 
     def __rtruediv__(self, other) -> "Element":
         """Performs division with another Element or scalar. This is the reverse fallback for division.
@@ -258,4 +614,14 @@ class Element:
         Returns:
             Element: A new Element representing the result.
         """
-        return other * self**-1
+        return Element(other) / self
+
+
+# Optional compiled scalar core: CElement is a Cython cdef-class drop-in for
+# pure-scalar graphs (see torchlet/_engine.pyx; built via
+# `python setup.py build_ext --inplace`). Falls back to the Python Element
+# when the extension is not built.
+try:
+    from torchlet._engine import CElement
+except ImportError:
+    CElement = Element
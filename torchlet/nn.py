@@ -1,135 +1,188 @@
-import random
-
-from torchlet.engine import Element
-
-
-class Module:
-    """Base class for all neural network modules."""
-
-    def zero_grad(self):
-        """Sets gradients of all parameters to zero."""
-        for p in self.parameters():
-            p.grad = 0
-
-    def parameters(self):
-        """Returns a list of all parameters.
-
-        Returns:
-            list: A list of parameters (Element objects).
-        """
-        return []
-
-
-class Neuron(Module):
-    """Represents a single neuron in the network.
-
-    Args:
-        nin (int): Number of input connections.
-        nonlin (bool): Whether to apply a non-linear activation function.
-    """
-
-    def __init__(self, nin, nonlin=True):
-        self.w = [Element(random.uniform(-1, 1)) for _ in range(nin)]
-        self.b = Element(0)
-        self.nonlin = nonlin
-
-    def __call__(self, x):
-        """Computes the output of the neuron for a given input.
-
-        Args:
-            x (list of Element): Input to the neuron.
-
-        Returns:
-            Element: The output of the neuron.
-        """
-        act = sum((wi * xi for wi, xi in zip(self.w, x)), self.b)
-        return act.relu() if self.nonlin else act
-
-    def parameters(self):
-        """Returns the parameters of the neuron.
-
-        Returns:
-            list: A list of parameters (Element objects).
-        """
-        return self.w + [self.b]
-
-    def __repr__(self):
-        """Returns a string representation of the Neuron."""
-        return f"{'ReLU' if self.nonlin else 'Linear'}Neuron({len(self.w)})"
-
-
-class Layer(Module):
-    """Represents a layer of neurons in the network.
-
-    Args:
-        nin (int): Number of input connections to each neuron.
-        nout (int): Number of neurons in the layer.
-    """
-
-    def __init__(self, nin, nout, **kwargs):
-        self.neurons = [Neuron(nin, **kwargs) for _ in range(nout)]
-
-    def __call__(self, x):
-        """Computes the output of the layer for a given input.
-
-        Args:
-            x (list of Element): Input to the layer.
-
-        Returns:
-            list or Element: The output of the layer.
-        """
-        out = [n(x) for n in self.neurons]
-        return out[0] if len(out) == 1 else out
-
-    def parameters(self):
-        """Returns the parameters of the layer.
-
-        Returns:
-            list: A list of parameters (Element objects).
-        """
-        return [p for n in self.neurons for p in n.parameters()]
-
-    def __repr__(self):
-        """Returns a string representation of the Layer."""
-        return f"Layer of [{', '.join(str(n) for n in self.neurons)}]"
-
-
-class MLP(Module):
-    """Represents a multi-layer perceptron (MLP) network.
-
-    Args:
-        nin (int): Number of input features.
-        nouts (list of int): List of output sizes for each layer.
-    """
-
-    def __init__(self, nin, nouts):
-        sz = [nin] + nouts
-        self.layers = [
-            Layer(sz[i], sz[i + 1], nonlin=i != len(nouts) - 1)
-            for i in range(len(nouts))
-        ]
-
-    def __call__(self, x):
-        """Computes the output of the MLP for a given input.
-
-        Args:
-            x (list of Element): Input to the MLP.
-
-        Returns:
-            list or Element: The output of the MLP.
-        """
-        for layer in self.layers:
-            x = layer(x)
-        return x
-
-    def parameters(self):
-        """Returns the parameters of the MLP.
-
-        Returns:
-            list: A list of parameters (Element objects).
-        """
-        return [p for layer in self.layers for p in layer.parameters()]
-
-    def __repr__(self):
-        """Returns a string representation of the MLP."""
-        return f"MLP of [{', '.join(str(layer) for layer in self.layers)}]"
+import numpy as np
+
+from torchlet.engine import Element
+
+
+def _stack_inputs(x):
+    """Stacks a list of Elements (or scalars) into a single vector Element.
+
+    Args:
+        x (Element or list): The input to stack.
+
+    Returns:
+        Element: A single Element holding the input vector.
+    """
+    if isinstance(x, Element):
+        return x
+    # The stacked vector is detached from the original scalars, so there is
+    # no one to propagate an input gradient to; skip its accumulation.
+    return Element(
+        np.array([xi.data if isinstance(xi, Element) else xi for xi in x]),
+        requires_grad=False,
+    )
+
+
+class Module:
+    """Base class for all neural network modules."""
+
+    def zero_grad(self):
+        """Sets gradients of all parameters to zero."""
+        for p in self.parameters():
+            if isinstance(p.grad, np.ndarray):
+                p.grad.fill(0.0)
+            elif p.grad is not None:
+                p.grad = 0.0
+
+    def parameters(self):
+        """Returns a list of all parameters.
+
+        Returns:
+            list: A list of parameters (Element objects).
+        """
+        return []
+
+
+class Neuron(Module):
+    """Represents a single neuron in the network.
+
+    The weights are held as one vector Element so the forward pass is a
+    single dot product instead of a chain of scalar operations.
+
+    Args:
+        nin (int): Number of input connections.
+        nonlin (bool): Whether to apply a non-linear activation function.
+    """
+
+    def __init__(self, nin, nonlin=True):
+        self.w = Element(np.random.uniform(-1, 1, nin))
+        self.b = Element(0)
+        self.nonlin = nonlin
+        self._params = [self.w, self.b]
+
+    def __call__(self, x):
+        """Computes the output of the neuron for a given input.
+
+        Args:
+            x (Element or list of Element): Input to the neuron.
+
+        Returns:
+            Element: The output of the neuron.
+        """
+        act = self.w.dot(_stack_inputs(x), self.b)
+        return act.relu() if self.nonlin else act
+
+    def parameters(self):
+        """Returns the parameters of the neuron.
+
+        Returns:
+            list: A list of parameters (Element objects).
+        """
+        return self._params
+
+    def __repr__(self):
+        """Returns a string representation of the Neuron."""
+        return f"{'ReLU' if self.nonlin else 'Linear'}Neuron({len(self.w.data)})"
+
+
+class Layer(Module):
+    """Represents a layer of neurons in the network.
+
+    The layer holds one weight Element of shape (nout, nin) and one bias
+    Element of shape (nout,), so the forward pass is a single `W @ x + b`
+    instead of per-neuron scalar graphs.
+
+    Args:
+        nin (int): Number of input connections to each neuron.
+        nout (int): Number of neurons in the layer.
+    """
+
+    def __init__(self, nin, nout, nonlin=True):
+        self.W = Element(np.random.uniform(-1, 1, (nout, nin)))
+        self.b = Element(np.zeros(nout))
+        self.nonlin = nonlin
+        self._params = [self.W, self.b]
+
+    def __call__(self, x):
+        """Computes the output of the layer for a given input.
+
+        Args:
+            x (Element or list of Element): Input to the layer.
+
+        Returns:
+            Element: The output vector of the layer.
+        """
+        act = self.W @ _stack_inputs(x) + self.b
+        return act.relu() if self.nonlin else act
+
+    def parameters(self):
+        """Returns the parameters of the layer.
+
+        Returns:
+            list: A list of parameters (Element objects).
+        """
+        return self._params
+
+    def __repr__(self):
+        """Returns a string representation of the Layer."""
+        nout, nin = self.W.data.shape
+        return f"Layer of [{nout} x {'ReLU' if self.nonlin else 'Linear'}Neuron({nin})]"
+
+
+class MLP(Module):
+    """Represents a multi-layer perceptron (MLP) network.
+
+    Args:
+        nin (int): Number of input features.
+        nouts (list of int): List of output sizes for each layer.
+    """
+
+    def __init__(self, nin, nouts):
+        sz = [nin] + nouts
+        self.layers = [
+            Layer(sz[i], sz[i + 1], nonlin=i != len(nouts) - 1)
+            for i in range(len(nouts))
+        ]
+        self._params = [p for layer in self.layers for p in layer.parameters()]
+        # Back all parameters by two flat contiguous buffers so zero_grad is a
+        # single C-level memset instead of a Python loop over Elements. Each
+        # parameter's data/grad is rebound to a view into the buffers.
+        params = self._params
+        self._param_data = np.concatenate([p.data.ravel() for p in params])
+        self._param_grad = np.zeros_like(self._param_data)
+        offset = 0
+        for p in params:
+            shape = p.data.shape
+            end = offset + p.data.size
+            p.data = self._param_data[offset:end].reshape(shape)
+            p.grad = self._param_grad[offset:end].reshape(shape)
+            offset = end
+
+    def zero_grad(self):
+        """Sets gradients of all parameters to zero."""
+        self._param_grad.fill(0.0)
+
+    def __call__(self, x):
+        """Computes the output of the MLP for a given input.
+
+        Args:
+            x (Element or list of Element): Input to the MLP.
+
+        Returns:
+            Element: The output vector of the MLP.
+        """
+        x = _stack_inputs(x)
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+    def parameters(self):
+        """Returns the parameters of the MLP.
+
+        Returns:
+            list: A list of parameters (Element objects).
+        """
+        return self._params
+
+    def __repr__(self):
+        """Returns a string representation of the MLP."""
+        return f"MLP of [{', '.join(str(layer) for layer in self.layers)}]"
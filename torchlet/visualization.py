@@ -1,41 +1,54 @@
+import functools
 import shutil
-import subprocess
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 from graphviz import Digraph
 
 
+@functools.lru_cache(maxsize=1)
 def check_graphviz_installed():
-    """Checks if Graphviz is installed on the system."""
-    graphviz_path = shutil.which("dot")
-    if graphviz_path is None:
-        return False
-    try:
-        subprocess.run(["dot", "-V"], capture_output=True, text=True)
-        return True
-    except Exception:
-        return False
+    """Checks if Graphviz is installed on the system.
+
+    The result is memoized: the PATH lookup already proves `dot` is
+    executable, and probing it with a subprocess on every visualize() call
+    cost a ~10 ms fork+exec.
+    """
+    return shutil.which("dot") is not None
 
 
 def trace(root):
     """Builds a set of all nodes and edges in a graph."""
     nodes, edges = set(), set()
-
-    def build(v):
-        if v not in nodes:
-            nodes.add(v)
-            for child in v._prev:
-                edges.add((child, v))
-                build(child)
-
-    build(root)
+    stack = [root]
+    while stack:
+        v = stack.pop()
+        if v in nodes:
+            continue
+        nodes.add(v)
+        for child in v._prev:
+            edges.add((child, v))
+            stack.append(child)
     return nodes, edges
 
 
 def format_value(value):
-    """Formats the value for display, handling None values."""
-    return f"{value:.4f}" if value is not None else "None"
+    """Formats the value for display, handling None and array values."""
+    if value is None:
+        return "None"
+    if isinstance(value, np.ndarray):
+        return np.array2string(value, precision=4)
+    return f"{value:.4f}"
+
+
+# Spring layouts are expensive; cache them so repeated draws of the same
+# (unchanged) graph skip the layout computation. Keyed on the root Element
+# itself (Elements hash by identity, and the graph reachable from a root never
+# changes), bounded with FIFO eviction so discarded graphs are not pinned in
+# memory forever.
+_layout_cache = {}
+_LAYOUT_CACHE_SIZE = 8
 
 
 def draw_matplotlib(root):
@@ -47,48 +60,37 @@ def draw_matplotlib(root):
     nodes, edges = trace(root)
     graph = nx.DiGraph()
 
-    # Add nodes and edges to the graph
+    # Build all node labels in a single pass over the nodes.
+    labels = {}
     for n in nodes:
-        value = format_value(n.data)
-        gradient = format_value(n.grad)
+        graph.add_node(n)
+        op = f"{n._op}\n" if n._op else ""
         label = n.label if n.label is not None else ""
-        node_label = f"{label}\nValue: {value}\nGrad: {gradient}"
-        graph.add_node(n, label=node_label)
-        for child in n._prev:
-            graph.add_edge(child, n)
-
-    pos = nx.spring_layout(graph)
-
-    # Draw nodes
-    nx.draw(
+        labels[n] = (
+            f"{op}{label}\n"
+            f"Value: {format_value(n.data)}\nGrad: {format_value(n.grad)}"
+        )
+    graph.add_edges_from(edges)
+
+    pos = _layout_cache.get(root)
+    if pos is None:
+        pos = nx.spring_layout(graph)
+        if len(_layout_cache) >= _LAYOUT_CACHE_SIZE:
+            _layout_cache.pop(next(iter(_layout_cache)))
+        _layout_cache[root] = pos
+
+    # Batched drawing: one collection for nodes and one for edges instead of
+    # per-node scatter calls.
+    nx.draw_networkx_nodes(
         graph,
         pos,
-        with_labels=False,
         node_size=2000,
         node_color="lightblue",
         node_shape="o",
         alpha=0.9,
     )
-    nx.draw_networkx_labels(
-        graph,
-        pos,
-        labels={n: n._op for n in nodes if n._op},
-        font_size=20,
-        font_color="red",
-    )
-    nx.draw_networkx_labels(
-        graph,
-        pos,
-        labels={
-            n: f"{n.label}\nValue: {format_value(n.data)}\nGrad: {format_value(n.grad)}"
-            for n in nodes
-        },
-        font_size=10,
-        font_color="black",
-    )
-
-    # Draw edges
     nx.draw_networkx_edges(graph, pos, arrows=True, arrowstyle="->", arrowsize=10)
+    nx.draw_networkx_labels(graph, pos, labels=labels, font_size=10, font_color="black")
 
     plt.title("Computational Graph")
     plt.show()
@@ -103,16 +105,18 @@ def draw_graphviz(root):
     dot = Digraph(format="png", graph_attr={"rankdir": "LR"})  # LR = left to right
 
     nodes, edges = trace(root)
+    # Precompute all record labels in one pass before touching the Digraph.
+    labels = {
+        id(n): (
+            f"{{ {n._op} | Value: {format_value(n.data)}"
+            f" | Grad: {format_value(n.grad)} }}"
+        )
+        for n in nodes
+    }
     for n in nodes:
         uid = str(id(n))
-        value = f"{n.data:.4f}" if n.data is not None else "None"
-        gradient = f"{n.grad:.4f}" if n.grad is not None else "None"
         # Create a rectangular node for each element in the graph
-        dot.node(
-            name=uid,
-            label=f"{{ {n._op} | Value: {value} | Grad: {gradient} }}",
-            shape="record",
-        )
+        dot.node(name=uid, label=labels[id(n)], shape="record")
         if n._op:
             # If this value is a result of some operation, create an op node for it
             dot.node(name=uid + n._op, label=n._op)